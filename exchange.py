@@ -1,32 +1,126 @@
 # Exchange Simulator
-import uuid
+import gc
+import sys
 import heapq
+import math
+import itertools
 import logging
 
-from decimal import Decimal, ROUND_HALF_UP as rnd
+from array import array
+from collections import deque
+from decimal import Decimal, ROUND_HALF_UP
+from enum import IntEnum
+from typing import NamedTuple
 
 logging.basicConfig(level=logging.DEBUG)
 LOGGER = logging.getLogger("Exchange Logger")
 
+TICK = 100  # prices are stored as integer ticks of 0.01
+LADDER_WINDOW = 4096  # price levels (in ticks) covered by each side's bitmap
+_ONE = Decimal(1)
+
+
+def _to_ticks(price) -> int:
+    """Convert a price to integer ticks.
+
+    str and Decimal prices are rounded exactly with ROUND_HALF_UP. int and float
+    prices take a fast path that rounds the float product ``price * TICK`` half
+    away from zero, so a float lying just below a half tick in binary (e.g. 0.015)
+    can round up where Decimal(price).quantize() would round down.
+    """
+    if isinstance(price, (int, float)):
+        scaled = price * TICK
+        if scaled >= 0:
+            return math.floor(scaled + 0.5)
+        return -math.floor(-scaled + 0.5)
+    return int((Decimal(str(price)) * TICK).quantize(_ONE, rounding=ROUND_HALF_UP))
+
+
+class Side(IntEnum):
+    """Order side. The value is the sign of the position change for the active side."""
+    BUY = 1
+    SELL = -1
+
+
+# Module-level aliases so hot paths can compare sides by identity
+BUY = Side.BUY
+SELL = Side.SELL
+
 
 class Order:
     """Represents a single order in the exchange."""
+    __slots__ = ('order_id', 'symbol', 'side', 'price', 'quantity', 'original_quantity', '_released')
     _symbol_seq = {}  # class-level dic to track seq per symbol
-
-    def __init__(self, symbol: str, side: str, price: float, quantity: int, order_id: int = None):
-        symbol_upper = symbol.upper()
-        if order_id is not None:
-            self.order_id = order_id
-        else:
-            # Increment sequence for this symbol
-            seq = Order._symbol_seq.get(symbol_upper, 1)
-            self.order_id = seq
-            Order._symbol_seq[symbol_upper] = seq + 1
-        self.symbol = symbol_upper
-        self.side = side.upper()  # 'BUY' or 'SELL'
-        self.price = Decimal(price).quantize(Decimal("0.01"), rounding=rnd)
+    _pool = []  # freelist of orders explicitly released by their owner
+    _pool_max = 4096  # cap on the freelist size
+
+    def __init__(self, symbol: str, side: Side | str, price: float, quantity: int, order_id: int):
+        if not isinstance(side, Side):
+            try:
+                side = Side[side.upper()] if isinstance(side, str) else Side(side)
+            except (KeyError, ValueError):
+                raise ValueError(f"Unknown order side: {side}") from None
+        self.order_id = order_id
+        self.symbol = sys.intern(symbol.upper())
+        self.side = side
+        self.price = _to_ticks(price)  # price in ticks
         self.quantity = int(quantity)
         self.original_quantity = int(quantity)  # Track original quantity
+        self._released = False  # True while sitting in the freelist
+
+    @classmethod
+    def _next_order_id(cls, symbol_upper: str) -> int:
+        # Increment sequence for this symbol
+        seq = cls._symbol_seq.get(symbol_upper, 1)
+        cls._symbol_seq[symbol_upper] = seq + 1
+        return seq
+
+    @classmethod
+    def new(cls, symbol: str, side: Side | str, price: float, quantity: int) -> "Order":
+        """Create an order with the next sequence id for its symbol."""
+        return cls(symbol, side, price, quantity, cls._next_order_id(symbol.upper()))
+
+    @classmethod
+    def replay(cls, symbol: str, side: Side, price: float, quantity: int, order_id: int) -> "Order":
+        """Create an order from a normalized tape: symbol must be upper case and side a Side."""
+        order = cls.__new__(cls)
+        order.order_id = order_id
+        order.symbol = sys.intern(symbol)
+        order.side = side
+        order.price = _to_ticks(price)
+        order.quantity = order.original_quantity = int(quantity)
+        order._released = False
+        return order
+
+    @classmethod
+    def acquire(cls, symbol: str, side: Side | str, price: float, quantity: int, order_id: int = None) -> "Order":
+        """Return an order reusing a released instance when one is available."""
+        if order_id is None:
+            order_id = cls._next_order_id(symbol.upper())
+        if cls._pool:
+            order = cls._pool.pop()
+            order.__init__(symbol, side, price, quantity, order_id)
+            return order
+        return cls(symbol, side, price, quantity, order_id)
+
+    @classmethod
+    def release(cls, order: "Order") -> None:
+        """Return an order to the freelist for reuse by acquire().
+
+        Orders are never released by the book itself: only release an order
+        you own and no longer reference, e.g. once it is filled.
+
+        Raises:
+            ValueError: If the order is already released, or still has open
+                quantity and so may be resting in a book
+        """
+        if order._released:
+            raise ValueError(f"Order {order.order_id} is already released")
+        if order.quantity > 0:
+            raise ValueError(f"Order {order.order_id} still has open quantity {order.quantity}")
+        order._released = True
+        if len(cls._pool) < cls._pool_max:
+            cls._pool.append(order)
 
     def execute(self, exec_quantity: int) -> int:
         """Execute a portion of the order and return the executed quantity.
@@ -53,128 +147,295 @@ class Order:
         
 
     def __repr__(self):
-        return (f"Order(order_id={self.order_id}, symbol='{self.symbol}', side='{self.side}', "
-                f"price={self.price}, quantity={self.quantity})")
+        return (f"Order(order_id={self.order_id}, symbol='{self.symbol}', side='{self.side.name}', "
+                f"price={self.price / TICK:.2f}, quantity={self.quantity})")
+
+
+class Trade(NamedTuple):
+    """A single executed trade, as yielded by OrderBook.trades_view()."""
+    symbol: str
+    buy_order_id: int
+    sell_order_id: int
+    price: int  # in ticks
+    quantity: int
+
+
+class SideBook:
+    """One side of an order book: a FIFO queue of resting orders per price level.
+
+    Populated levels within LADDER_WINDOW ticks of ``base`` are tracked in a
+    bitmap; levels outside that window fall back to a heap. Whenever the
+    bitmap drains, the window is re-centred on the next best price and any
+    out-of-window levels that now fit are moved back into it. A level that
+    stays populated inside the window pins it in place, so prices trending
+    away from such a level keep landing in the heap until it empties.
+    """
+
+    def __init__(self, is_bid: bool):
+        self.is_bid = is_bid
+        self.levels = {}  # price -> deque of resting orders in time priority
+        self.base = 0  # price of bit 0 in the bitmap
+        self.bitmap = 0  # bit (price - base) is set iff that in-window level is populated
+        self._outside = []  # heap of populated out-of-window levels, negated for bids
+        self.best_price = None  # best populated price, None when this side is empty
+        self.order_count = 0
+
+    def __len__(self):
+        return self.order_count
+
+    def _best_in_window(self):
+        bitmap = self.bitmap
+        if not bitmap:
+            return None
+        if self.is_bid:
+            return bitmap.bit_length() - 1 + self.base  # highest set bit
+        return (bitmap & -bitmap).bit_length() - 1 + self.base  # lowest set bit
+
+    def _recentre(self, price):
+        # Only called while the bitmap is empty: every populated level is in the heap
+        base = self.base = price - LADDER_WINDOW // 2
+        bitmap = 0
+        outside = []
+        for key in self._outside:
+            offset = (-key if self.is_bid else key) - base
+            if 0 <= offset < LADDER_WINDOW:
+                bitmap |= 1 << offset
+            else:
+                outside.append(key)
+        heapq.heapify(outside)
+        self.bitmap = bitmap
+        self._outside = outside
+
+    def _best_outside(self):
+        if not self._outside:
+            return None
+        top = self._outside[0]
+        return -top if self.is_bid else top
+
+    def prices(self):
+        """Yield the populated price levels from best to worst."""
+        is_bid = self.is_bid
+        base = self.base
+        # Out-of-window levels in priority order, split by which side of the window they lie on
+        outside = [-key if is_bid else key for key in sorted(self._outside)]
+        if is_bid:
+            better = [p for p in outside if p >= base + LADDER_WINDOW]
+            worse = [p for p in outside if p < base]
+        else:
+            better = [p for p in outside if p < base]
+            worse = [p for p in outside if p >= base + LADDER_WINDOW]
+        yield from better
+        bitmap = self.bitmap  # at most LADDER_WINDOW bits wide
+        while bitmap:
+            if is_bid:
+                offset = bitmap.bit_length() - 1
+            else:
+                offset = (bitmap & -bitmap).bit_length() - 1
+            bitmap ^= 1 << offset
+            yield base + offset
+        yield from worse
+
+    def __iter__(self):
+        """Iterate resting orders in priority order: best price first, then oldest."""
+        levels = self.levels
+        for price in self.prices():
+            yield from levels[price]
+
+    def add(self, order: Order) -> None:
+        """Append an order to the back of its price level."""
+        price = order.price
+        queue = self.levels.get(price)
+        if queue is None:
+            if not self.bitmap:
+                self._recentre(price)
+            offset = price - self.base
+            if 0 <= offset < LADDER_WINDOW:
+                self.bitmap |= 1 << offset
+            else:
+                heapq.heappush(self._outside, -price if self.is_bid else price)
+            queue = self.levels[price] = deque()
+            best = self.best_price
+            if best is None or (price > best if self.is_bid else price < best):
+                self.best_price = price
+        queue.append(order)
+        self.order_count += 1
+
+    def pop_best(self) -> Order:
+        """Remove and return the oldest order at the best price level."""
+        price = self.best_price
+        queue = self.levels[price]
+        order = queue.popleft()
+        self.order_count -= 1
+        if not queue:
+            del self.levels[price]
+            offset = price - self.base
+            if 0 <= offset < LADDER_WINDOW:
+                self.bitmap ^= 1 << offset
+            else:
+                # Levels only ever empty from the top, so this is the heap top
+                heapq.heappop(self._outside)
+            if not self.bitmap and self._outside:
+                self._recentre(self._best_outside())
+            inside = self._best_in_window()
+            outside = self._best_outside()
+            if inside is None or outside is None:
+                self.best_price = outside if inside is None else inside
+            else:
+                self.best_price = max(inside, outside) if self.is_bid else min(inside, outside)
+        return order
 
 
 class OrderBook:
     """Order book for a single symbol"""
     _registry = []  # Class-level list to track all OrderBook instances
+    _anon_seq = itertools.count()  # numbering for books created without a symbol
 
     def __init__(self, symbol: str = None):
-        self.symbol = symbol or uuid.uuid4().hex[:3].upper() # Create randomly if not given
-        self.bids = []  # max-heap: (-price, order_id, order) i.e. larger price is better
-        self.offers = []  # min-heap: (price, order_id, order) i.e. smaller price is better
-        self.trades = []  # List of executed trades: dicts with info
-        self.positions = {}  # symbol -> net position (int)
+        self.symbol = sys.intern(symbol or f"ANON{next(OrderBook._anon_seq):06d}") # Generate if not given
+        self.bids = SideBook(is_bid=True)  # larger price is better
+        self.offers = SideBook(is_bid=False)  # smaller price is better
+        # Executed trades, stored column-wise (one int64 array per field)
+        self.trade_buy_ids = array('q')
+        self.trade_sell_ids = array('q')
+        self.trade_prices = array('q')
+        self.trade_qtys = array('q')
+        self.position = 0  # net position in this book's symbol
         OrderBook._registry.append(self)
 
-    def _record_trade(self, buy_id, sell_id, price, quantity, active_side=None):
-        trade = {
-            'symbol': self.symbol,
-            'buy_order_id': buy_id,
-            'sell_order_id': sell_id,
-            'price': price,
-            'quantity': quantity
-        }
-        self.trades.append(trade)
-        # Update position for symbol: + for buy, - for sell
-        if active_side == 'BUY':
-            self.positions[self.symbol] = self.positions.get(self.symbol, 0) + quantity
-        elif active_side == 'SELL':
-            self.positions[self.symbol] = self.positions.get(self.symbol, 0) - quantity
-        else:
-            # fallback: do nothing
-            pass
-
-    def _match_order(self, order, heap, price_getter, price_cmp, trade_log_fmt, heap_pop, price_sign=1):
-        while heap and order.quantity > 0:
-            best_price_raw, best_id, best_order = heap[0]
-            best_price = price_sign * best_price_raw
-            if price_cmp(order.price, best_price):
-                trade_qty = min(order.quantity, best_order.quantity)
-                LOGGER.info(trade_log_fmt.format(trade_qty=trade_qty, price=best_price, buy_id=order.order_id, sell_id=best_order.order_id))
-                
-                # Use the new execute method instead of direct quantity manipulation
-                actual_trade_qty = order.execute(trade_qty)
-                best_order.execute(actual_trade_qty)
-                
-                self._record_trade(
-                    buy_id=order.order_id if order.side == 'BUY' else best_order.order_id,
-                    sell_id=best_order.order_id if order.side == 'BUY' else order.order_id,
-                    price=best_price,
-                    quantity=actual_trade_qty,
-                    active_side=order.side
-                )
-                
-                if best_order.is_filled():
-                    heapq.heappop(heap)
-                else:
-                    break  # Partial fill, stop matching
+    def _record_trade(self, buy_id, sell_id, price, quantity, active_side: Side):
+        self.trade_buy_ids.append(buy_id)
+        self.trade_sell_ids.append(sell_id)
+        self.trade_prices.append(price)
+        self.trade_qtys.append(quantity)
+        # Update position: + for buy, - for sell
+        self.position += active_side * quantity
+
+    def trades_view(self):
+        """Return a lazy iterator of Trade tuples; wrap it in list() to index it."""
+        return map(Trade._make, zip(itertools.repeat(self.symbol), self.trade_buy_ids,
+                                    self.trade_sell_ids, self.trade_prices, self.trade_qtys))
+
+    def _match_buy(self, order):
+        offers = self.offers
+        levels = offers.levels
+        pop_best = offers.pop_best
+        log_trades = LOGGER.isEnabledFor(logging.INFO)
+        limit_price = order.price
+        order_id = order.order_id
+        while order.quantity > 0:
+            best_price = offers.best_price
+            if best_price is None or limit_price < best_price:
+                break  # No match (further)
+            best_order = levels[best_price][0]
+            trade_qty = min(order.quantity, best_order.quantity)
+            if log_trades:
+                LOGGER.info("Executed: BUY %d @ %.2f between Order %s and %s",
+                            trade_qty, best_price / TICK, order_id, best_order.order_id)
+
+            # Inlined Order.execute: add_order only admits positive quantities,
+            # so trade_qty is always a valid fill for both orders
+            order.quantity -= trade_qty
+            best_order.quantity -= trade_qty
+            self._record_trade(
+                buy_id=order_id,
+                sell_id=best_order.order_id,
+                price=best_price,
+                quantity=trade_qty,
+                active_side=BUY
+            )
+
+            if best_order.quantity == 0:
+                pop_best()
             else:
+                break  # Partial fill, stop matching
+        return order.quantity == 0  # True if fully matched
+
+    def _match_sell(self, order):
+        bids = self.bids
+        levels = bids.levels
+        pop_best = bids.pop_best
+        log_trades = LOGGER.isEnabledFor(logging.INFO)
+        limit_price = order.price
+        order_id = order.order_id
+        while order.quantity > 0:
+            best_price = bids.best_price
+            if best_price is None or limit_price > best_price:
                 break  # No match (further)
-        return order.is_filled()  # True if fully matched
+            best_order = levels[best_price][0]
+            trade_qty = min(order.quantity, best_order.quantity)
+            if log_trades:
+                LOGGER.info("Executed: SELL %d @ %.2f between Order# %s and %s",
+                            trade_qty, best_price / TICK, order_id, best_order.order_id)
+
+            # Inlined Order.execute: add_order only admits positive quantities,
+            # so trade_qty is always a valid fill for both orders
+            order.quantity -= trade_qty
+            best_order.quantity -= trade_qty
+            self._record_trade(
+                buy_id=best_order.order_id,
+                sell_id=order_id,
+                price=best_price,
+                quantity=trade_qty,
+                active_side=SELL
+            )
+
+            if best_order.quantity == 0:
+                pop_best()
+            else:
+                break  # Partial fill, stop matching
+        return order.quantity == 0  # True if fully matched
 
     def add_order(self, order: Order) -> None:
+        """Match an order against the book and rest any unfilled remainder.
+
+        Raises:
+            ValueError: If the order's symbol does not match the book, or its
+                quantity is not positive (the matching loops rely on this)
+        """
         if order.symbol != self.symbol:
             raise ValueError(f"Order symbol '{order.symbol}' does not match OrderBook symbol '{self.symbol}'")
-        LOGGER.info(f'Adding Order: {order}')
-
-        if order.side == 'BUY':
-            fully_matched = self._match_order(
-                order,
-                self.offers,
-                lambda x: x[0],
-                lambda buy, offer: buy >= offer,
-                "Executed: BUY {trade_qty} @ {price} between Order {buy_id} and {sell_id}",
-                heapq.heappop,
-                price_sign=1
-            )
-            if not fully_matched:
-                heapq.heappush(self.bids, (-order.price, order.order_id, order))
-        elif order.side == 'SELL':
-            fully_matched = self._match_order(
-                order,
-                self.bids,
-                lambda x: -x[0],
-                lambda sell, bid: sell <= bid,
-                "Executed: SELL {trade_qty} @ {price} between Order# {sell_id} and {buy_id}",
-                heapq.heappop,
-                price_sign=-1
-            )
-            if not fully_matched:
-                heapq.heappush(self.offers, (order.price, order.order_id, order))
+        if order.quantity <= 0:
+            raise ValueError(f"Order quantity must be positive, got {order.quantity}")
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info("Adding Order: %r", order)
+
+        if order.side is BUY:
+            if not self._match_buy(order):
+                self.bids.add(order)
+        elif order.side is SELL:
+            if not self._match_sell(order):
+                self.offers.add(order)
         else:
             raise Exception(f"Unknown order side: {order.side}")
 
     def display_book(self) -> None:
         total_orders = len(self.bids) + len(self.offers)
-        LOGGER.info(f'Display Order Book: {self.symbol} | Total Orders: {total_orders}')
+        LOGGER.info("Display Order Book: %s | Total Orders: %d", self.symbol, total_orders)
         print("\n" + "#"*34)
         print("#          BUY ORDERS            #")
         print("#"*34)
-        for _, _, order in sorted(self.bids, reverse=True):
+        for order in self.bids:
             print(order)
         print("#"*34)
         print("#          SELL ORDERS           #")
         print("#"*34)
-        for _, _, order in sorted(self.offers):
+        for order in self.offers:
             print(order)
         print()
 
     def show_trades(self) -> None:
         print("\n########## EXECUTED TRADES ##########")
-        if not self.trades:
+        if not self.trade_qtys:
             print("No trades executed.")
         else:
-            for t in self.trades:
-                print(f"Trade: {t['symbol']} | BUY Order #{t['buy_order_id']} <-> SELL Order #{t['sell_order_id']} | Qty: {t['quantity']} @ {t['price']}")
+            for t in self.trades_view():
+                print(f"Trade: {t.symbol} | BUY Order #{t.buy_order_id} <-> SELL Order #{t.sell_order_id} | Qty: {t.quantity} @ {t.price / TICK:.2f}")
         print("#"*36)
 
     def show_position(self) -> None:
         print("\n########## POSITION ##########")
-        for symbol, qty in self.positions.items():
-            print(f"{symbol}: {qty}")
+        if self.trade_qtys:  # no position line until the book has traded
+            print(f"{self.symbol}: {self.position}")
         print("#"*24)
 
     @classmethod
@@ -182,60 +443,71 @@ class OrderBook:
         print("\n########## ALL EXECUTED TRADES ##########")
         for book in cls._registry:
             print(f"[OrderBook: {book.symbol}]")
-            if not book.trades:
+            if not book.trade_qtys:
                 print("  No trades executed.")
             else:
-                for t in book.trades:
-                    print(f"  Trade: {t['symbol']} | BUY Order #{t['buy_order_id']} <-> SELL Order #{t['sell_order_id']} | Qty: {t['quantity']} @ {t['price']}")
+                for t in book.trades_view():
+                    print(f"  Trade: {t.symbol} | BUY Order #{t.buy_order_id} <-> SELL Order #{t.sell_order_id} | Qty: {t.quantity} @ {t.price / TICK:.2f}")
         print("#"*36)
 
     @classmethod
     def show_all_positions(cls):
         print("\n########## ALL POSITIONS ##########")
         for book in cls._registry:
-            for symbol, qty in book.positions.items():
-                print(f"[OrderBook: {book.symbol}] {symbol}: {qty}")
+            if book.trade_qtys:  # skip books that never traded
+                print(f"[OrderBook: {book.symbol}] {book.symbol}: {book.position}")
         print("#"*24)
 
 def send_order(order_book, order_list):
-    """Send a list of orders to the given order book using add_order."""
-    for order in order_list:
-        order_book.add_order(order)
+    """Send a list of orders to the given order book using add_order.
+
+    The cyclic garbage collector is paused for the batch so collection pauses
+    do not land in the middle of matching; its previous state is restored after.
+    """
+    add_order = order_book.add_order  # bind once for the whole batch
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for order in order_list:
+            add_order(order)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
 
 
 def main():
     # Create new market base for TESLA
     tesla_book = OrderBook('TESLA')
-    o1 = Order(symbol='TESLA', side='BUY', price=100.00, quantity=35)
-    o2 = Order(symbol='TESLA', side='SELL', price=102.00, quantity=10)
-    o3 = Order(symbol='TESLA', side='SELL', price=101.00, quantity=30)
+    o1 = Order.new(symbol='TESLA', side='BUY', price=100.00, quantity=35)
+    o2 = Order.new(symbol='TESLA', side='SELL', price=102.00, quantity=10)
+    o3 = Order.new(symbol='TESLA', side='SELL', price=101.00, quantity=30)
     send_order(tesla_book,[o1,o2,o3])
     tesla_book.display_book()
 
     # Enter new orders to cross
-    o4 = Order(symbol='TESLA', side='BUY', price=103.00, quantity=10) # take partially (10) on o3
-    o5 = Order(symbol='TESLA', side='BUY', price=103.00, quantity=10) # take again partially (10) on o3
-    o6 = Order(symbol='TESLA', side='BUY', price=103.00, quantity=30) # take fully (10) on o3, then on o2(10), the rest (10) remains
-    o7 = Order(symbol='TESLA', side='SELL', price=100.00, quantity=60) # take
+    o4 = Order.new(symbol='TESLA', side='BUY', price=103.00, quantity=10) # take partially (10) on o3
+    o5 = Order.new(symbol='TESLA', side='BUY', price=103.00, quantity=10) # take again partially (10) on o3
+    o6 = Order.new(symbol='TESLA', side='BUY', price=103.00, quantity=30) # take fully (10) on o3, then on o2(10), the rest (10) remains
+    o7 = Order.new(symbol='TESLA', side='SELL', price=100.00, quantity=60) # take
     send_order(tesla_book, [o4,o5,o6,o7])
 
 
      # Create new market base for TOYOTA
     toyota_book = OrderBook('TOYOTA')
-    oo1 = Order(symbol='TOYOTA', side='BUY', price=100.00, quantity=10)
-    oo2 = Order(symbol='TOYOTA', side='SELL', price=101.00, quantity=10)
-    oo3 = Order(symbol='TOYOTA', side='BUY', price=100.00, quantity=10)
+    oo1 = Order.new(symbol='TOYOTA', side='BUY', price=100.00, quantity=10)
+    oo2 = Order.new(symbol='TOYOTA', side='SELL', price=101.00, quantity=10)
+    oo3 = Order.new(symbol='TOYOTA', side='BUY', price=100.00, quantity=10)
     send_order(toyota_book, [oo1,oo2,oo3])
     toyota_book.display_book()
 
     # Enter new orders to cross
-    oo4 = Order(symbol='TOYOTA', side='SELL', price=100.00, quantity=20) # first take on oo1 then on oo3
+    oo4 = Order.new(symbol='TOYOTA', side='SELL', price=100.00, quantity=20) # first take on oo1 then on oo3
     send_order(toyota_book, [oo4])
 
 
     # Create new market base for BYD
     byd_book = OrderBook('BYD')
-    ooo1 = Order(symbol='BYD', side='BUY', price=100.00, quantity=10)
+    ooo1 = Order.new(symbol='BYD', side='BUY', price=100.00, quantity=10)
 
 
     # Summary of executed trades and positions
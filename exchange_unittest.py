@@ -1,6 +1,11 @@
+import io
 import unittest
+import unittest.mock
 import exchange
 import logging
+
+from decimal import Decimal
+
 LOGGER = logging.getLogger(__name__)
 LOGGER.setLevel(logging.DEBUG)
 
@@ -9,6 +14,7 @@ class TestExchange(unittest.TestCase):
         # Clear OrderBook registry and Order sequence for clean tests
         exchange.OrderBook._registry.clear()
         exchange.Order._symbol_seq.clear()
+        exchange.Order._pool.clear()
 
     def test_order(self):
         LOGGER.info('Creating Order')
@@ -17,49 +23,286 @@ class TestExchange(unittest.TestCase):
         price = 105.25
         quantity = 25
 
-        order = exchange.Order(symbol, side, price, quantity)
+        order = exchange.Order.new(symbol, side, price, quantity)
         self.assertEqual(order.symbol, symbol)
-        self.assertEqual(order.side, side)
-        self.assertEqual(order.price, exchange.Decimal(str(price)).quantize(exchange.Decimal("0.01"), rounding=exchange.rnd))
+        self.assertIs(order.side, exchange.Side.BUY)
+        self.assertEqual(order.price, 10525)
         self.assertEqual(order.quantity, quantity)
         self.assertIsNotNone(order.order_id)
 
+    def test_order_new_assigns_sequence_per_symbol(self):
+        t1 = exchange.Order.new('tesla', 'buy', 100.00, 10)
+        t2 = exchange.Order.new('TESLA', 'SELL', 100.00, 10)
+        y1 = exchange.Order.new('TOYOTA', 'BUY', 100.00, 10)
+        self.assertEqual((t1.order_id, t2.order_id, y1.order_id), (1, 2, 1))
+        self.assertEqual((t1.symbol, t1.side), ('TESLA', exchange.Side.BUY))
+        self.assertIs(t1.symbol, t2.symbol)
+
+    def test_order_rejects_unknown_side(self):
+        with self.assertRaises(ValueError):
+            exchange.Order.new('TESLA', 'HOLD', 100.00, 10)
+        for side in (0, 2, None, []):
+            with self.assertRaises(ValueError):
+                exchange.Order.new('TESLA', side, 100.00, 10)
+
+    def test_order_accepts_side_values(self):
+        self.assertIs(exchange.Order.new('TESLA', 1, 100.00, 10).side, exchange.BUY)
+        self.assertIs(exchange.Order.new('TESLA', -1, 100.00, 10).side, exchange.SELL)
+
+    def test_order_replay_keeps_given_id(self):
+        order = exchange.Order.replay('TESLA', exchange.SELL, 101.25, 7, order_id=42)
+        self.assertEqual(order.order_id, 42)
+        self.assertEqual(order.symbol, 'TESLA')
+        self.assertIs(order.side, exchange.SELL)
+        self.assertEqual(order.price, 10125)
+        self.assertEqual(order.quantity, 7)
+        self.assertEqual(order.original_quantity, 7)
+        self.assertEqual(exchange.Order._symbol_seq, {})
+
+    def test_order_price_rounds_half_up(self):
+        self.assertEqual(exchange.Order.new('TESLA', 'BUY', 0.125, 1).price, 13)
+        self.assertEqual(exchange.Order.new('TESLA', 'BUY', 100.125, 1).price, 10013)
+        self.assertEqual(exchange.Order.new('TESLA', 'BUY', Decimal('100.125'), 1).price, 10013)
+        self.assertEqual(exchange.Order.new('TESLA', 'BUY', '100.124', 1).price, 10012)
+        self.assertEqual(exchange.Order.replay('TESLA', exchange.SELL, -0.125, 1, order_id=1).price, -13)
+
+    def test_order_price_rounds_decimal_and_str_exactly(self):
+        self.assertEqual(exchange.Order.new('TESLA', 'BUY', Decimal('1.005'), 1).price, 101)
+        self.assertEqual(exchange.Order.new('TESLA', 'BUY', '1.005', 1).price, 101)
+        self.assertEqual(exchange.Order.new('TESLA', 'BUY', '0.015', 1).price, 2)
+        self.assertEqual(exchange.Order.new('TESLA', 'SELL', Decimal('-0.015'), 1).price, -2)
+
+    def test_order_float_price_rounds_float_product(self):
+        # 0.015 * 100 == 1.5 in float arithmetic, so the fast path rounds it up
+        self.assertEqual(exchange.Order.new('TESLA', 'BUY', 0.015, 1).price, 2)
+        self.assertEqual(exchange.Order.new('TESLA', 'BUY', 105, 1).price, 10500)
+
+    def test_order_has_no_instance_dict(self):
+        order = exchange.Order.new('TESLA', 'BUY', 100.00, 10)
+        self.assertFalse(hasattr(order, '__dict__'))
+        with self.assertRaises(AttributeError):
+            order.note = 'not a slot'
+
+    def test_order_pool_reuses_only_released_orders(self):
+        book = exchange.OrderBook('TESLA')
+        s1 = exchange.Order.acquire('TESLA', 'SELL', 100.00, 10)
+        b1 = exchange.Order.acquire('TESLA', 'BUY', 100.00, 10)
+        exchange.send_order(book, [s1, b1])
+        # Filling an order never hands it to the freelist
+        self.assertEqual(exchange.Order._pool, [])
+        self.assertIsNot(exchange.Order.acquire('TESLA', 'BUY', 99.00, 1), s1)
+        self.assertEqual(s1.price, 10000)
+        exchange.Order.release(s1)
+        self.assertEqual(exchange.Order._pool, [s1])
+        reused = exchange.Order.acquire('TESLA', 'BUY', 101.00, 5)
+        self.assertIs(reused, s1)
+        self.assertIs(reused.side, exchange.BUY)
+        self.assertEqual(reused.price, 10100)
+        self.assertEqual(reused.quantity, 5)
+        self.assertEqual(reused.original_quantity, 5)
+        self.assertEqual(reused.order_id, 4)
+        self.assertEqual(exchange.Order._pool, [])
+
+    def test_order_release_rejects_double_release(self):
+        book = exchange.OrderBook('TESLA')
+        s1 = exchange.Order.new('TESLA', 'SELL', 100.00, 10)
+        exchange.send_order(book, [s1, exchange.Order.new('TESLA', 'BUY', 100.00, 10)])
+        exchange.Order.release(s1)
+        with self.assertRaises(ValueError):
+            exchange.Order.release(s1)
+        self.assertEqual(exchange.Order._pool, [s1])
+        first = exchange.Order.acquire('TESLA', 'BUY', 100.00, 1)
+        second = exchange.Order.acquire('TESLA', 'BUY', 100.00, 1)
+        self.assertIsNot(first, second)
+
+    def test_order_release_rejects_open_orders(self):
+        book = exchange.OrderBook('TESLA')
+        b1 = exchange.Order.new('TESLA', 'BUY', 1.00, 10)
+        exchange.send_order(book, [b1])
+        with self.assertRaises(ValueError):
+            exchange.Order.release(b1)
+        self.assertEqual(exchange.Order._pool, [])
+        exchange.Order.acquire('TESLA', 'SELL', 9.00, 1)
+        self.assertIs(b1.side, exchange.BUY)
+        self.assertEqual(list(book.bids.levels[100]), [b1])
+
     def test_orderbook_add_and_match(self):
         book = exchange.OrderBook('TESLA')
-        b1 = exchange.Order('TESLA', 'BUY', 100.00, 10)
-        s1 = exchange.Order('TESLA', 'SELL', 99.00, 10)
+        b1 = exchange.Order.new('TESLA', 'BUY', 100.00, 10)
+        s1 = exchange.Order.new('TESLA', 'SELL', 99.00, 10)
         exchange.send_order(book, [b1, s1])
         # Should match and not remain in book
         self.assertEqual(len(book.bids), 0)
         self.assertEqual(len(book.offers), 0)
-        self.assertEqual(len(book.trades), 1)
-        self.assertEqual(book.trades[0]['quantity'], 10)
-        self.assertEqual(book.positions['TESLA'], -10)
+        trades = list(book.trades_view())
+        self.assertEqual(len(trades), 1)
+        self.assertEqual(trades[0].quantity, 10)
+        self.assertEqual(trades[0], exchange.Trade('TESLA', b1.order_id, s1.order_id, 10000, 10))
+        self.assertEqual(book.position, -10)
+
+    def test_add_order_rejects_non_positive_quantity(self):
+        book = exchange.OrderBook('TESLA')
+        with self.assertRaises(ValueError):
+            book.add_order(exchange.Order.new('TESLA', 'BUY', 100.00, 0))
+        with self.assertRaises(ValueError):
+            book.add_order(exchange.Order.new('TESLA', 'SELL', 100.00, -5))
+        self.assertEqual(len(book.bids), 0)
+        self.assertEqual(len(book.offers), 0)
+
+    def test_price_time_priority(self):
+        book = exchange.OrderBook('TESLA')
+        s1 = exchange.Order.new('TESLA', 'SELL', 101.00, 10)
+        s2 = exchange.Order.new('TESLA', 'SELL', 100.00, 10)
+        s3 = exchange.Order.new('TESLA', 'SELL', 100.00, 10)
+        exchange.send_order(book, [s1, s2, s3])
+        self.assertEqual(book.offers.best_price, 10000)
+        b1 = exchange.Order.new('TESLA', 'BUY', 101.00, 25)
+        exchange.send_order(book, [b1])
+        # Best price first, then oldest order within the level
+        self.assertEqual([t.sell_order_id for t in book.trades_view()], [s2.order_id, s3.order_id, s1.order_id])
+        self.assertEqual(len(book.offers), 1)
+        self.assertEqual(book.offers.best_price, 10100)
+        self.assertEqual(s1.quantity, 5)
+
+    def test_ladder_bitmap_tracks_levels(self):
+        book = exchange.OrderBook('TESLA')
+        b1 = exchange.Order.new('TESLA', 'BUY', 99.00, 10)
+        b2 = exchange.Order.new('TESLA', 'BUY', 98.50, 10)
+        exchange.send_order(book, [b1, b2])
+        self.assertEqual(book.bids.best_price, 9900)
+        base = book.bids.base
+        self.assertEqual(base, 9900 - exchange.LADDER_WINDOW // 2)
+        self.assertEqual(book.bids.bitmap, (1 << (9900 - base)) | (1 << (9850 - base)))
+        s1 = exchange.Order.new('TESLA', 'SELL', 99.00, 10)
+        exchange.send_order(book, [s1])
+        self.assertEqual(book.bids.best_price, 9850)
+        self.assertEqual(book.bids.bitmap, 1 << (9850 - base))
+        self.assertEqual(book.offers.bitmap, 0)
+        self.assertIsNone(book.offers.best_price)
+
+    def test_ladder_window_is_bounded(self):
+        book = exchange.OrderBook('TESLA')
+        s1 = exchange.Order.new('TESLA', 'SELL', 1000000.00, 10)
+        s2 = exchange.Order.new('TESLA', 'SELL', 900000.00, 10)  # outside the window
+        s3 = exchange.Order.new('TESLA', 'SELL', 1000001.00, 10)
+        exchange.send_order(book, [s1, s2, s3])
+        self.assertLessEqual(book.offers.bitmap.bit_length(), exchange.LADDER_WINDOW)
+        self.assertEqual(book.offers.best_price, 90000000)
+        b1 = exchange.Order.new('TESLA', 'BUY', 1000001.00, 25)
+        exchange.send_order(book, [b1])
+        self.assertEqual([t.sell_order_id for t in book.trades_view()], [s2.order_id, s1.order_id, s3.order_id])
+        self.assertEqual(book.offers.best_price, 100000100)
+        self.assertEqual(list(book.offers), [s3])
+
+    def test_ladder_window_follows_trending_prices(self):
+        book = exchange.OrderBook('TESLA')
+        exchange.send_order(book, [exchange.Order.new('TESLA', 'SELL', 100.00, 1)])
+        for step in range(1, 6):
+            previous, price = 100.00 + 30 * (step - 1), 100.00 + 30 * step
+            exchange.send_order(book, [exchange.Order.new('TESLA', 'SELL', price, 1)])
+            self.assertEqual(len(book.offers._outside), 1)  # beyond the current window
+            exchange.send_order(book, [exchange.Order.new('TESLA', 'BUY', previous, 1)])
+            # The window drained, so it re-centres on the remaining level
+            self.assertEqual(book.offers._outside, [])
+            self.assertEqual(book.offers.base, exchange._to_ticks(price) - exchange.LADDER_WINDOW // 2)
+            self.assertEqual(book.offers.best_price, exchange._to_ticks(price))
+            self.assertEqual(len(book.offers), 1)
+
+    def test_negative_price_matches_and_rests(self):
+        book = exchange.OrderBook('TESLA')
+        b1 = exchange.Order.new('TESLA', 'BUY', 1.00, 5)
+        s1 = exchange.Order.new('TESLA', 'SELL', -1.00, 10)
+        exchange.send_order(book, [b1, s1])
+        self.assertEqual(book.position, -5)
+        self.assertEqual(next(book.trades_view()).price, 100)
+        self.assertEqual(book.offers.best_price, -100)
+        self.assertEqual(list(book.offers), [s1])
+        self.assertEqual(s1.quantity, 5)
+
+    def test_add_order_skips_repr_when_info_disabled(self):
+        book = exchange.OrderBook('TESLA')
+        order = exchange.Order.new('TESLA', 'BUY', 100.00, 10)
+        previous_level = exchange.LOGGER.level
+        exchange.LOGGER.setLevel(logging.WARNING)
+        try:
+            with unittest.mock.patch.object(exchange.Order, '__repr__') as mock_repr:
+                book.add_order(order)
+            mock_repr.assert_not_called()
+        finally:
+            exchange.LOGGER.setLevel(previous_level)
+
+    def test_side_book_iterates_in_priority_order(self):
+        book = exchange.OrderBook('TESLA')
+        b1 = exchange.Order.new('TESLA', 'BUY', 99.00, 10)
+        b2 = exchange.Order.new('TESLA', 'BUY', 100.00, 10)
+        b3 = exchange.Order.new('TESLA', 'BUY', 99.00, 10)
+        s1 = exchange.Order.new('TESLA', 'SELL', 102.00, 10)
+        s2 = exchange.Order.new('TESLA', 'SELL', 101.00, 10)
+        exchange.send_order(book, [b1, b2, b3, s1, s2])
+        self.assertEqual(list(book.bids.prices()), [10000, 9900])
+        self.assertEqual(list(book.bids), [b2, b1, b3])
+        self.assertEqual(list(book.offers.prices()), [10100, 10200])
+        self.assertEqual(list(book.offers), [s2, s1])
+
+    def test_side_book_prices_include_out_of_window_levels(self):
+        book = exchange.OrderBook('TESLA')
+        window = exchange.LADDER_WINDOW / exchange.TICK
+        prices = [500.00, 500.00 + window, 500.01, 500.00 - window, 499.99]
+        exchange.send_order(book, [exchange.Order.new('TESLA', 'BUY', p, 1) for p in prices])
+        expected = sorted({exchange._to_ticks(p) for p in prices}, reverse=True)
+        self.assertEqual(list(book.bids.prices()), expected)
+        exchange.send_order(book, [exchange.Order.new('TESLA', 'SELL', p, 1) for p in [1000.00, 2000.00 + window, 1000.01, 1000.00 - window]])
+        self.assertEqual(list(book.offers.prices()), sorted(book.offers.levels))
+
+    def test_send_order_restores_gc_state(self):
+        book = exchange.OrderBook('TESLA')
+        self.assertTrue(exchange.gc.isenabled())
+        with self.assertRaises(ValueError):
+            exchange.send_order(book, [exchange.Order.new('TOYOTA', 'BUY', 100.00, 10)])
+        self.assertTrue(exchange.gc.isenabled())
+        exchange.gc.disable()
+        try:
+            exchange.send_order(book, [exchange.Order.new('TESLA', 'BUY', 100.00, 10)])
+            self.assertFalse(exchange.gc.isenabled())
+        finally:
+            exchange.gc.enable()
 
     def test_short_position(self):
         book = exchange.OrderBook('TESLA')
-        s1 = exchange.Order('TESLA', 'SELL', 100.00, 10)
-        b1 = exchange.Order('TESLA', 'BUY', 101.00, 5)
-        b2 = exchange.Order('TESLA', 'BUY', 101.00, 5)
+        s1 = exchange.Order.new('TESLA', 'SELL', 100.00, 10)
+        b1 = exchange.Order.new('TESLA', 'BUY', 101.00, 5)
+        b2 = exchange.Order.new('TESLA', 'BUY', 101.00, 5)
         exchange.send_order(book, [s1, b1, b2])
-        self.assertEqual(book.positions['TESLA'], 10)
+        self.assertEqual(book.position, 10)
         # Now add another sell to go short
-        s2 = exchange.Order('TESLA', 'SELL', 99.00, 5)
+        s2 = exchange.Order.new('TESLA', 'SELL', 99.00, 5)
         exchange.send_order(book, [s2])
-        self.assertEqual(book.positions['TESLA'], 10)
+        self.assertEqual(book.position, 10)
+
+    def test_anonymous_books_get_distinct_symbols(self):
+        first = exchange.OrderBook()
+        second = exchange.OrderBook()
+        self.assertTrue(first.symbol.startswith('ANON'))
+        self.assertNotEqual(first.symbol, second.symbol)
 
     def test_all_books_summary(self):
         tesla_book = exchange.OrderBook('TESLA')
         toyota_book = exchange.OrderBook('TOYOTA')
-        t1 = exchange.Order('TESLA', 'BUY', 100, 10)
-        t2 = exchange.Order('TESLA', 'SELL', 100, 10)
-        y1 = exchange.Order('TOYOTA', 'BUY', 100, 5)
-        y2 = exchange.Order('TOYOTA', 'SELL', 100, 5)
+        t1 = exchange.Order.new('TESLA', 'BUY', 100, 10)
+        t2 = exchange.Order.new('TESLA', 'SELL', 100, 10)
+        y1 = exchange.Order.new('TOYOTA', 'BUY', 100, 5)
+        y2 = exchange.Order.new('TOYOTA', 'SELL', 100, 5)
         exchange.send_order(tesla_book, [t1, t2])
         exchange.send_order(toyota_book, [y1, y2])
+        exchange.OrderBook('BYD')  # never trades
         # Should not raise and should print summary
         exchange.OrderBook.show_all_trades()
-        exchange.OrderBook.show_all_positions()
+        with unittest.mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            exchange.OrderBook.show_all_positions()
+        lines = out.getvalue().splitlines()
+        self.assertIn("[OrderBook: TESLA] TESLA: -10", lines)
+        self.assertIn("[OrderBook: TOYOTA] TOYOTA: -5", lines)
+        self.assertFalse(any("BYD" in line for line in lines))
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)